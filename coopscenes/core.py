@@ -5,16 +5,18 @@ for .4mse files.
 
 Classes:
     DataRecord: Represents a data record in the AMEISE-Record format. Handles loading frames from a .4mse file,
-                provides access to individual frames, and serializes frames into bytes.
+                provides access to individual frames, and serializes frames into bytes. Frame metadata can be
+                read without loading the sensor data for indexing.
 
     Dataloader: Manages the loading of AMEISE-Record files from a specified directory. Provides access to these
                 records and allows for retrieval by index or filename.
 """
-from typing import List, Optional, Iterator, Union, Generator
+from typing import Any, Dict, List, Optional, Iterator, Union, Generator
 import os
 import glob
 from coopscenes.data import *
-from coopscenes.miscellaneous import InvalidFileTypeError, obj_to_bytes, obj_from_bytes, INT_LENGTH
+from coopscenes.miscellaneous import InvalidFileTypeError, obj_to_bytes, obj_from_bytes, INT_LENGTH, \
+    SHA256_CHECKSUM_LENGTH
 
 
 class DataRecord:
@@ -105,6 +107,37 @@ class DataRecord:
             yield Frame.from_bytes(self.frames_data[start_pos:end_pos])
             start_pos = end_pos
 
+    @staticmethod
+    def load_metadata_only(record_file: str) -> List[Dict[str, Any]]:
+        """Read the metadata of all frames in an AMEISE-Record file without loading the sensor data.
+
+        Only the frame headers are read from the file, the camera and lidar payloads are skipped.
+        This is intended for indexing records; the frame checksums are not verified.
+
+        Args:
+            record_file (str): Path to the AMEISE-Record file.
+
+        Returns:
+            List[Dict[str, Any]]: The 'frame_id', 'timestamp' and 'version' of each frame.
+
+        Raises:
+            InvalidFileTypeError: If the provided file is not in the .4mse format.
+        """
+        if os.path.splitext(record_file)[1] != ".4mse":
+            raise InvalidFileTypeError("This is not a valid AMEISE-Record file.")
+        metadata = []
+        with open(record_file, 'rb') as file:
+            frame_lengths_len: int = int.from_bytes(file.read(INT_LENGTH), 'big')
+            frame_lengths: List[int] = obj_from_bytes(file.read(frame_lengths_len))
+            frame_start = file.tell()
+            for frame_length in frame_lengths:
+                file.seek(frame_start + SHA256_CHECKSUM_LENGTH)
+                meta_len = int.from_bytes(file.read(INT_LENGTH), 'big')
+                frame_id, timestamp, version = obj_from_bytes(file.read(meta_len))
+                metadata.append({'frame_id': frame_id, 'timestamp': timestamp, 'version': version})
+                frame_start += frame_length
+        return metadata
+
     @staticmethod
     def to_bytes(frames: List[Frame]) -> bytes:
         """Serialize a list of frames into bytes.
@@ -116,13 +149,13 @@ class DataRecord:
             bytes: The serialized byte representation of the frames.
         """
         frame_lengths: List[int] = []
-        frames_bytes = b""
+        frames_bytes: List[bytes] = []
         for _frame in frames:
             frame_bytes = _frame.to_bytes()
             frame_lengths.append(len(frame_bytes))
-            frames_bytes += frame_bytes
+            frames_bytes.append(frame_bytes)
         frame_lengths_bytes = obj_to_bytes(frame_lengths)
-        return frame_lengths_bytes + frames_bytes
+        return b''.join([frame_lengths_bytes] + frames_bytes)
 
 
 class Dataloader:
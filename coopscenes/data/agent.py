@@ -37,6 +37,7 @@ class VisionSensorsVeh:
     """
 
     _CAMERA_NAMES = ['BACK_LEFT', 'FRONT_LEFT', 'STEREO_LEFT', 'STEREO_RIGHT', 'FRONT_RIGHT', 'BACK_RIGHT', 'REAR']
+    _ITER_NAMES = tuple(name for name in _CAMERA_NAMES if name != 'STEREO_RIGHT')
 
     def __init__(self):
         """Initialize the VisionSensorsVeh object with all cameras set to None."""
@@ -50,9 +51,9 @@ class VisionSensorsVeh:
 
     def __iter__(self):
         """Make the object iterable over its cameras, excluding 'STEREO_RIGHT'."""
-        for name in self._CAMERA_NAMES:
+        for name in self._ITER_NAMES:
             camera = getattr(self, name)
-            if camera is not None and name != 'STEREO_RIGHT':
+            if camera is not None:
                 yield name, camera
 
     def __len__(self):
@@ -306,8 +307,9 @@ class Tower:
         Returns:
             bytes: The serialized byte representation of the tower, including sensor and GNSS data.
         """
-        tower_bytes = obj_to_bytes(self.info) + self.cameras.to_bytes() + self.lidars.to_bytes() + serialize(self.GNSS)
-        return len(tower_bytes).to_bytes(INT_LENGTH, 'big') + tower_bytes
+        blocks = [obj_to_bytes(self.info), self.cameras.to_bytes(), self.lidars.to_bytes(), serialize(self.GNSS)]
+        tower_len = sum(len(block) for block in blocks)
+        return b''.join([tower_len.to_bytes(INT_LENGTH, 'big')] + blocks)
 
     @classmethod
     def from_bytes(cls, data) -> 'Tower':
@@ -368,15 +370,17 @@ class Vehicle:
         Returns:
             bytes: The serialized byte representation of the vehicle, including sensor and dynamics data.
         """
-        vehicle_bytes = (
-                obj_to_bytes(self.info)
-                + self.cameras.to_bytes()
-                + self.lidars.to_bytes()
-                + serialize(self.IMU)
-                + serialize(self.GNSS)
-                + serialize(self.DYNAMICS)
-        )
-        return len(vehicle_bytes).to_bytes(INT_LENGTH, 'big') + vehicle_bytes
+        blocks = [
+            obj_to_bytes(self.info),
+            self.cameras.to_bytes(),
+            self.lidars.to_bytes(),
+            serialize(self.IMU),
+            serialize(self.GNSS),
+            serialize(self.DYNAMICS)
+        ]
+        vehicle_len = sum(len(block) for block in blocks)
+        # Join all blocks at once, chaining `+` would copy the accumulated camera payload for every block
+        return b''.join([vehicle_len.to_bytes(INT_LENGTH, 'big')] + blocks)
 
     @classmethod
     def from_bytes(cls, data) -> 'Vehicle':
@@ -231,9 +231,16 @@ class Position(TimestampMixin, ReprFormaterMixin):
 class Image(TimestampMixin):
     """Class representing an image along with its metadata.
 
+    The image data can be held either as a PIL image or as a NumPy array. An array-backed image creates
+    its PIL image lazily on first access and caches it, so processing steps working on arrays do not pay
+    for PIL conversions unless the PIL image is actually needed. The array of a PIL-backed image is not
+    cached: `np.asarray` copies the pixel data, and caching the copy would keep a second full-size buffer
+    alive next to the decoded image. Each access of `image_np` on a PIL-backed image therefore costs one copy.
+
     Attributes:
         timestamp (Optional[Decimal]): Timestamp of the image.
         image (Optional[PilImage]): The actual image data.
+        image_np (Optional[np.ndarray]): The image data as a NumPy array.
         labels (Optional[ImageLabels]): The labels associated with the image.
     """
 
@@ -246,10 +253,51 @@ class Image(TimestampMixin):
             timestamp (Optional[Decimal]): Timestamp of the image.
             labels (Optional[ImageLabels]): The labels associated with the image.
         """
-        self.image = image
+        self._image = image
+        self._image_np = None
+        # Calibration key of the rectification applied to this image, None for raw images
+        self._rect_key: Optional[tuple] = None
         self.timestamp = timestamp
         self.labels = labels
 
+    @classmethod
+    def from_array(cls, image_np: np.ndarray, timestamp: Optional[Decimal] = None,
+                   labels: Optional[ImageLabels] = None) -> 'Image':
+        """Create an Image object backed by a NumPy array.
+
+        Args:
+            image_np (np.ndarray): The image data as a NumPy array.
+            timestamp (Optional[Decimal]): Timestamp of the image.
+            labels (Optional[ImageLabels]): The labels associated with the image.
+
+        Returns:
+            Image: The Image object, the PIL image is only created when accessed.
+        """
+        instance = cls(timestamp=timestamp, labels=labels)
+        instance._image_np = image_np
+        return instance
+
+    @property
+    def image(self) -> Optional[PilImage]:
+        """Get the image data as a PIL image, created from the NumPy array if necessary."""
+        if self._image is None and self._image_np is not None:
+            self._image = PilImage.fromarray(self._image_np)
+        return self._image
+
+    @image.setter
+    def image(self, image: Optional[PilImage]):
+        """Set the image data as a PIL image and drop the cached NumPy array and rectification state."""
+        self._image = image
+        self._image_np = None
+        self._rect_key = None
+
+    @property
+    def image_np(self) -> Optional[np.ndarray]:
+        """Get the image data as a NumPy array, copied from the PIL image on each access if not array-backed."""
+        if self._image_np is None and self._image is not None:
+            return np.asarray(self._image)
+        return self._image_np
+
     def __getattr__(self, attr) -> PilImage:
         """
         Enables direct access to attributes of the `image` object.
@@ -296,11 +344,11 @@ class Image(TimestampMixin):
         lbl_bytes, _ = read_data_block(data)
 
         img_instance = cls()
-        img_instance.timestamp = Decimal(ts_bytes.decode('utf-8'))
+        img_instance.timestamp = Decimal(bytes(ts_bytes).decode('utf-8'))
         img_instance.labels = obj_from_bytes(lbl_bytes)
 
         if Config.REPACK:
-            img_instance._img_bytes = img_bytes
+            img_instance._img_bytes = bytes(img_bytes)
 
         img_stream = BytesIO(img_bytes)
         img_instance.image = PilImage.open(img_stream)
@@ -392,10 +440,10 @@ class Points(TimestampMixin):
 
         ts_bytes, _ = read_data_block(data)
         pts_instance = cls()
-        pts_instance.timestamp = Decimal(ts_bytes.decode('utf-8'))
+        pts_instance.timestamp = Decimal(bytes(ts_bytes).decode('utf-8'))
 
         if Config.REPACK:
-            pts_instance._pts_bytes = pts_bytes
+            pts_instance._pts_bytes = bytes(pts_bytes)
 
         pts_instance.points = np.frombuffer(pts_bytes_uncompressed, dtype=dtype)
         return pts_instance
@@ -11,13 +11,18 @@ Functions:
     to_bytes: Serializes the `Frame` object to a byte stream, including a checksum for data integrity.
     from_bytes: Deserializes a byte stream to create a `Frame` object, verifying the checksum.
     is_complete: Checks if all sensors in the `Frame` are filled.
+    iter_cameras: Iterates over the cameras of all agents in the `Frame`.
+    iter_camera_arrays: Iterates over the raw camera images of the `Frame` as NumPy arrays.
     get_timestamp: Converts the frame's timestamp to a formatted UTC string with specified precision.
 """
+from typing import Iterator, Tuple
 from decimal import Decimal
 from coopscenes.miscellaneous import obj_to_bytes, obj_from_bytes, read_data_block, compute_checksum, \
     ChecksumError, TimestampMixin, ReprFormaterMixin
-from coopscenes.data import Tower, Vehicle, VisionSensorsVeh, VisionSensorsTow, LaserSensorsVeh, LaserSensorsTow
+from coopscenes.data import Camera, CameraInformation, Tower, Vehicle, VisionSensorsVeh, VisionSensorsTow, \
+    LaserSensorsVeh, LaserSensorsTow
 from coopscenes.miscellaneous.helper import read_checksum
+import numpy as np
 
 
 class Frame(TimestampMixin, ReprFormaterMixin):
@@ -67,6 +72,40 @@ class Frame(TimestampMixin, ReprFormaterMixin):
         yield self.vehicle
         yield self.tower
 
+    def iter_cameras(self, include_stereo_right: bool = True) -> Iterator[Tuple[str, Camera]]:
+        """Iterate over the cameras of the vehicle and the tower.
+
+        Unlike iterating over `vehicle.cameras`, the right stereo camera is included by default, so batch
+        operations such as the rectification of all cameras cover every camera of the frame.
+
+        Args:
+            include_stereo_right (bool): Whether to yield the right stereo camera of the vehicle. Defaults to True.
+
+        Yields:
+            Tuple[str, Camera]: The name of the camera and the Camera object.
+        """
+        for agent in self:
+            yield from agent.cameras
+            if include_stereo_right and isinstance(agent, Vehicle) and agent.cameras.STEREO_RIGHT is not None:
+                yield 'STEREO_RIGHT', agent.cameras.STEREO_RIGHT
+
+    def iter_camera_arrays(self, include_stereo_right: bool = True) \
+            -> Iterator[Tuple[str, np.ndarray, CameraInformation]]:
+        """Iterate over the raw camera images of the vehicle and the tower as NumPy arrays.
+
+        This allows batch operations on the images without going through the Camera and Image objects.
+        Cameras without a raw image are skipped.
+
+        Args:
+            include_stereo_right (bool): Whether to yield the right stereo camera of the vehicle. Defaults to True.
+
+        Yields:
+            Tuple[str, np.ndarray, CameraInformation]: The name of the camera, the raw image and the camera information.
+        """
+        for name, camera in self.iter_cameras(include_stereo_right):
+            if camera._image_raw is not None:
+                yield name, camera._image_raw.image_np, camera.info
+
     def to_bytes(self) -> bytes:
         """Serialize the Frame object, including metadata, vehicle, and tower data, to bytes.
 
@@ -82,9 +121,9 @@ class Frame(TimestampMixin, ReprFormaterMixin):
         tow_bytes = self.tower.to_bytes()
 
         # Combine all serialized components
-        frame_bytes = meta_bytes + veh_bytes + tow_bytes
+        frame_bytes = b''.join([meta_bytes, veh_bytes, tow_bytes])
         # Add checksum for data integrity
-        safe_frame_bytes = compute_checksum(frame_bytes) + frame_bytes
+        safe_frame_bytes = b''.join([compute_checksum(frame_bytes), frame_bytes])
         return safe_frame_bytes
 
     @classmethod
@@ -105,7 +144,9 @@ class Frame(TimestampMixin, ReprFormaterMixin):
         if compute_checksum(data) != frame_checksum:
             raise ChecksumError("Checksum mismatch. Data might be corrupted!")
 
-        # Deserialize metadata, vehicle, and tower blocks
+        # Deserialize metadata, vehicle, and tower blocks. A memoryview lets every nested block be sliced
+        # without copying the remaining frame data at each step.
+        data = memoryview(data)
         meta_bytes, data = read_data_block(data)
         vehicle_bytes, data = read_data_block(data)
         tower_bytes, _ = read_data_block(data)
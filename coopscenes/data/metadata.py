@@ -308,6 +308,11 @@ class CameraInformation(ReprFormaterMixin):
         self.extrinsic = extrinsic
         self.stereo_transform = stereo_transform
 
+    @property
+    def distortion_mtx_trimmed(self) -> np.ndarray:
+        """Get the distortion coefficients without the last entry as a C-contiguous float64 array, as used by OpenCV."""
+        return np.ascontiguousarray(self.distortion_mtx[:-1], dtype=np.float64)
+
     def __repr__(self):
         """Return a string representation of the CameraInformation object with key attributes."""
         return (
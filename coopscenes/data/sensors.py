@@ -32,6 +32,8 @@ class Camera:
     Attributes:
         info (Optional[CameraInformation]): Metadata about the camera.
         _image_raw (Optional[Image]): The raw image data.
+        _image_rect (Optional[Image]): The cached rectified image data. It is reset whenever `info` or
+            `_image_raw` is replaced and is never handed out directly.
     """
 
     def __init__(self, info: Optional[CameraInformation] = None, image: Optional[Image] = None):
@@ -43,21 +45,65 @@ class Camera:
         """
         self.info = info
         self._image_raw = image
+        self._image_rect = None
 
     @property
-    def image(self) -> PilImage:
+    def info(self) -> Optional[CameraInformation]:
+        """Get the camera metadata."""
+        return self._info
+
+    @info.setter
+    def info(self, info: Optional[CameraInformation]):
+        """Set the camera metadata and drop the cached rectified image."""
+        self._info = info
+        self._image_rect = None
+
+    @property
+    def _image_raw(self) -> Optional[Image]:
+        """Get the raw image data."""
+        return self._raw_image
+
+    @_image_raw.setter
+    def _image_raw(self, image: Optional[Image]):
+        """Set the raw image data and drop the cached rectified image."""
+        self._raw_image = image
+        self._image_rect = None
+
+    @property
+    def image(self) -> Image:
         """Get the rectified image from the raw data.
 
+        The image is rectified on first access and cached for subsequent accesses. Every access returns a new
+        `Image` backed by a read-only view of the cached array, so drawing on the returned image does not alter
+        the cache.
+
         Returns:
-            PilImage: The rectified image as a PIL image object.
+            Image: The rectified image.
+
+        Raises:
+            AttributeError: If the raw image data is not set.
+        """
+        if self._image_rect is None:
+            self.rectify()
+        image_np = self._image_rect.image_np.view()
+        image_np.flags.writeable = False
+        image = Image.from_array(image_np, self._image_rect.timestamp, self._image_rect.labels)
+        image._rect_key = self._image_rect._rect_key
+        return image
+
+    def rectify(self, performance_mode: bool = True):
+        """Rectify the raw image and store it as the cached rectified image.
+
+        Args:
+            performance_mode (bool): If True, linear interpolation is used, otherwise Lanczos4. Defaults to True.
 
         Raises:
             AttributeError: If the raw image data is not set.
         """
-        from coopscenes.utils import get_rect_img
-        if self._image_raw is not None:
-            return get_rect_img(self)
-        raise AttributeError("Image is not set.")
+        from coopscenes.utils import get_rect_img_raw
+        if self._image_raw is None:
+            raise AttributeError("Image is not set.")
+        self._image_rect = get_rect_img_raw(self._image_raw, self.info, performance_mode)
 
     def __getattr__(self, attr) -> PilImage:
         """Handle dynamic access to raw image attributes."""
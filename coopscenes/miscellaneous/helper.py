@@ -156,7 +156,7 @@ def read_data_block(data: bytes, dtype_length: int = INT_LENGTH) -> Tuple[bytes,
     length of the following data block. It then extracts that block of bytes.
 
     Args:
-        data (bytes): The input byte stream.
+        data (bytes): The input byte stream (bytes or memoryview, slicing a memoryview does not copy).
         dtype_length (int): The length of the size header in bytes. Defaults to INT_LENGTH.
 
     Returns:
@@ -226,7 +226,7 @@ def deserialize(data: bytes, cls, *args) -> Tuple[Optional[object], bytes]:
     is used to extract the object, and the remaining data is returned.
 
     Args:
-        data (bytes): The byte stream to be deserialized.
+        data (bytes): The byte stream to be deserialized (bytes or memoryview).
         cls (class): The class type that has a `from_bytes()` method for deserialization.
         *args: Additional arguments passed to the class's `from_bytes()` method.
 
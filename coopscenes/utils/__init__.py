@@ -1,5 +1,7 @@
 from .transformation import Transformation, get_transformation, transform_points_to_origin, get_deskewed_points
 from .fusion import get_projection, combine_lidar_points, get_rgb_projection, remove_hidden_points
-from .image import get_rect_img, get_depth_map, get_disparity_map, disparity_to_depth
+from .image import get_rect_img, get_rect_img_raw, get_rect_imgs, get_depth_map, get_disparity_map, \
+    get_disparity_map_census, get_num_disparities, disparity_to_depth, StereoDepthEstimator
 from .visualisation import get_colored_stereo_image, show_points, plot_points_on_image, get_projection_img
-from .managing import get_maneuver_split, save_dataset_images_multithreaded, save_image, save_all_images_in_frame
+from .managing import get_maneuver_split, save_dataset_images_multithreaded, save_image, save_all_images_in_frame, \
+    rectify_frame_multithreaded
@@ -3,92 +3,655 @@ This module provides functions for processing and handling images.
 It includes functionalities for image rectification, disparity and depth map computation.
 
 Functions:
-    get_rect_img(data, performance_mode):
+    get_rect_img(data, performance_mode, use_opencl):
         Rectify the provided image using the camera's intrinsic and extrinsic parameters.
 
-    get_disparity_map(camera_left, camera_right, stereo_param):
+    get_rect_img_raw(image, camera_info, performance_mode, use_opencl):
+        Rectify an Image with the given CameraInformation.
+
+    get_rect_imgs(data, performance_mode, use_opencl):
+        Rectify a batch of images, optionally pipelined on an OpenCL device.
+
+    get_disparity_map(camera_left, camera_right, stereo_param, num_disparities, min_depth, scale, backend,
+                      num_threads):
         Compute a disparity map from a pair of stereo images.
 
-    get_depth_map(camera_left, camera_right, stereo_param):
+    get_depth_map(camera_left, camera_right, stereo_param, num_disparities, min_depth, scale, backend,
+                  num_threads):
         Generate a depth map from a pair of stereo camera images.
 
+    get_disparity_map_census(img_left_gray, img_right_gray, max_disp, window_size):
+        Compute a disparity map from rectified grayscale images with a census transform matcher.
+
+    get_num_disparities(camera_info, min_depth):
+        Derive the disparity search range of the default matcher for a stereo camera.
+
     disparity_to_depth(disparity_map, camera_info):
         Convert a disparity map into a depth map using camera parameters.
+
+Classes:
+    StereoDepthEstimator:
+        Compute depth maps for a fixed stereo camera pair, reusing maps, matcher and buffers across frames.
 """
-from typing import Optional, Tuple, Union
-from PIL import Image as PilImage
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from coopscenes.data import CameraInformation, Camera, Image
 from coopscenes.utils import Transformation
+from concurrent.futures import ThreadPoolExecutor
+from functools import singledispatch
+import importlib.util
+import threading
 import numpy as np
 import cv2
 
+if importlib.util.find_spec("numba") is not None:
+    import numba
+
+    @numba.njit(parallel=True, cache=True)
+    def _depth_from_disparity_numba(disparity_map: np.ndarray, focal_baseline: float, depth_map: np.ndarray):
+        """Fill depth_map with focal_baseline / disparity in a single parallel pass over the rows."""
+        height, width = disparity_map.shape
+        for y in numba.prange(height):
+            for x in range(width):
+                disparity = disparity_map[y, x]
+                depth_map[y, x] = focal_baseline / disparity if disparity > 0 else np.inf
+
+    @numba.njit(parallel=True, cache=True)
+    def _census_transform_numba(img_gray: np.ndarray, descriptor: np.ndarray):
+        """Fill descriptor with the 9x7 center-symmetric census transform, parallel over the rows."""
+        height, width = img_gray.shape
+        for y in numba.prange(height):
+            for x in range(width):
+                value = np.uint32(0)
+                bit = 0
+                for dy in range(-3, 1):
+                    for dx in range(-4, 5):
+                        if dy == 0 and dx >= 0:
+                            break
+                        # Replicate the image border
+                        y1, x1 = min(max(y + dy, 0), height - 1), min(max(x + dx, 0), width - 1)
+                        y2, x2 = min(max(y - dy, 0), height - 1), min(max(x - dx, 0), width - 1)
+                        if img_gray[y1, x1] > img_gray[y2, x2]:
+                            value |= np.uint32(1) << np.uint32(bit)
+                        bit += 1
+                descriptor[y, x] = value
+
+    @numba.njit(cache=True)
+    def _census_row_cost(desc_left: np.ndarray, desc_right: np.ndarray, y: int, popcount: np.ndarray,
+                         invalid_cost: int, row_cost: np.ndarray):
+        """Compute the Hamming costs of image row y for every column and disparity."""
+        width = desc_left.shape[1]
+        num_disp = row_cost.shape[1]
+        # Reversed right row, so the descriptors of increasing disparities are contiguous in memory
+        right_reversed = desc_right[y, ::-1].copy()
+        for x in range(width):
+            desc = desc_left[y, x]
+            num_valid = min(num_disp, x + 1)
+            offset = width - 1 - x
+            for disp in range(num_valid):
+                diff = desc ^ right_reversed[offset + disp]
+                row_cost[x, disp] = popcount[diff & 0xFFFF] + popcount[diff >> 16]
+            row_cost[x, num_valid:] = invalid_cost
+
+    @numba.njit(cache=True)
+    def _select_census_row(col_cost: np.ndarray, radius: int, agg_cost: np.ndarray, disparity_row: np.ndarray):
+        """Aggregate the column costs horizontally and pick the sub-pixel disparity with the lowest cost."""
+        width, num_disp = col_cost.shape
+        agg_cost[:] = 0
+        for dx in range(-radius, radius + 1):
+            agg_cost += col_cost[min(max(dx, 0), width - 1)]
+        for x in range(width):
+            if x > 0:
+                entering, leaving = col_cost[min(x + radius, width - 1)], col_cost[max(x - radius - 1, 0)]
+                for disp in range(num_disp):
+                    agg_cost[disp] += entering[disp] - leaving[disp]
+            best_disp = 0
+            best_cost = agg_cost[0]
+            for disp in range(1, num_disp):
+                if agg_cost[disp] < best_cost:
+                    best_cost = agg_cost[disp]
+                    best_disp = disp
+            disparity = np.float32(best_disp)
+            # The parabola needs both neighbors, so the first and last disparity are not refined
+            if 0 < best_disp < num_disp - 1:
+                cost_before, cost, cost_after = agg_cost[best_disp - 1], agg_cost[best_disp], agg_cost[best_disp + 1]
+                denom = cost_before - 2 * cost + cost_after
+                if denom > 0:
+                    disparity += (cost_before - cost_after) / (2 * denom)
+            disparity_row[x] = disparity * 16
+
+    @numba.njit(parallel=True, cache=True)
+    def _census_match_numba(desc_left: np.ndarray, desc_right: np.ndarray, num_disp: int, radius: int,
+                            popcount: np.ndarray, invalid_cost: int, band_height: int, disparity_map: np.ndarray):
+        """Match census descriptors in horizontal bands, parallel over the bands.
+
+        Each band keeps the costs summed over the vertical aggregation window per column and disparity and
+        slides them down one row at a time. The costs of the rows inside the window are kept in a ring buffer,
+        so the Hamming distances of every row are computed once per band.
+        """
+        height, width = desc_left.shape
+        window = 2 * radius + 1
+        num_bands = (height + band_height - 1) // band_height
+        for band in numba.prange(num_bands):
+            y_start = band * band_height
+            y_end = min(y_start + band_height, height)
+            row_costs = np.empty((window, width, num_disp), dtype=np.uint8)
+            # The window sums reach window_size ** 2 * 32, which overflows int16 from a window size of 33
+            col_cost = np.zeros((width, num_disp), dtype=np.int32)
+            agg_cost = np.empty(num_disp, dtype=np.int32)
+            for slot in range(window):
+                _census_row_cost(desc_left, desc_right, min(max(y_start - radius + slot, 0), height - 1),
+                                 popcount, invalid_cost, row_costs[slot])
+                col_cost += row_costs[slot]
+            for y in range(y_start, y_end):
+                if y > y_start:
+                    # The slot of the row leaving the window is reused for the row entering it
+                    slot = (y - y_start - 1) % window
+                    col_cost -= row_costs[slot]
+                    _census_row_cost(desc_left, desc_right, min(y + radius, height - 1),
+                                     popcount, invalid_cost, row_costs[slot])
+                    col_cost += row_costs[slot]
+                _select_census_row(col_cost, radius, agg_cost, disparity_map[y])
+else:
+    _depth_from_disparity_numba = None
+    _census_transform_numba = None
+    _census_match_numba = None
+
+# CUDA stereo matchers and device buffers, kept per thread as they are not safe to share
+_CUDA_STATE = threading.local()
+
+# Undistort/rectify maps per calibration, keyed by the content of the calibration matrices
+_MAP_CACHE: Dict[Tuple, Tuple[np.ndarray, np.ndarray]] = {}
+_UMAP_CACHE: Dict[Tuple, Tuple[cv2.UMat, cv2.UMat]] = {}
+
+
+def _get_rectification_key(camera_info: CameraInformation) -> Tuple:
+    """Build a hashable key from the calibration parameters that define the rectification maps."""
+    return (
+        tuple(camera_info.shape),
+        camera_info.camera_mtx.tobytes(),
+        camera_info.distortion_mtx.tobytes(),
+        camera_info.rectification_mtx.tobytes(),
+        camera_info.projection_mtx.tobytes()
+    )
+
+
+def _get_rectification_maps(camera_info: CameraInformation,
+                            key: Optional[Tuple] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the undistort/rectify maps for a camera, computing them only once per calibration.
 
-def get_rect_img(data: Union[Camera, Tuple[Image, CameraInformation]], performance_mode: bool = False) -> Image:
+    Frames are deserialized into new `CameraInformation` objects, so the cache is keyed by the
+    calibration content rather than by object identity.
+    """
+    key = key or _get_rectification_key(camera_info)
+    maps = _MAP_CACHE.get(key)
+    if maps is None:
+        maps = cv2.initUndistortRectifyMap(
+            cameraMatrix=np.ascontiguousarray(camera_info.camera_mtx, dtype=np.float64),
+            distCoeffs=camera_info.distortion_mtx_trimmed,
+            R=np.ascontiguousarray(camera_info.rectification_mtx, dtype=np.float64),
+            newCameraMatrix=np.ascontiguousarray(camera_info.projection_mtx, dtype=np.float64),
+            size=tuple(camera_info.shape),
+            m1type=cv2.CV_16SC2
+        )
+        _MAP_CACHE[key] = maps
+    return maps
+
+
+def _get_rectification_umaps(camera_info: CameraInformation,
+                             key: Optional[Tuple] = None) -> Tuple[cv2.UMat, cv2.UMat]:
+    """Return the rectification maps of a camera as UMat, uploaded only once per calibration."""
+    key = key or _get_rectification_key(camera_info)
+    umaps = _UMAP_CACHE.get(key)
+    if umaps is None:
+        mapx, mapy = _get_rectification_maps(camera_info, key)
+        umaps = (cv2.UMat(mapx), cv2.UMat(mapy))
+        _UMAP_CACHE[key] = umaps
+    return umaps
+
+
+def _opencl_available() -> bool:
+    """Check whether OpenCV can dispatch UMat operations to an OpenCL device."""
+    return cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+
+
+@singledispatch
+def get_rect_img(data: Union[Camera, Tuple[Image, CameraInformation]], performance_mode: bool = True,
+                 use_opencl: bool = False) -> Image:
     """Rectify the provided image using either a Camera object or an Image with CameraInformation.
 
     Performs image rectification using the camera matrix, distortion coefficients, rectification matrix,
-    and projection matrix. The rectified image is returned as an `Image` object.
+    and projection matrix. The rectification maps are computed once per calibration and reused for
+    subsequent calls. The rectified image is returned as an `Image` object. The implementation is selected
+    by the type of `data`; loops that already hold the Image and CameraInformation can call
+    `get_rect_img_raw` directly.
 
     Args:
         data (Union[Camera, Tuple[Image, CameraInformation]]): Either a Camera object containing the image and calibration parameters,
             or a tuple of an Image object and a CameraInformation object.
-        performance_mode (bool, optional): If True, faster interpolation (linear) will be used; otherwise, higher quality (Lanczos4) will be used. Defaults to False.
+        performance_mode (bool, optional): If True, bilinear interpolation on the fixed-point maps is used, which runs
+            on OpenCV's vectorized remap path. Set to False to opt in to the slower, higher quality Lanczos4
+            interpolation. Defaults to True.
+        use_opencl (bool, optional): If True and OpenCL is available to OpenCV, the remapping runs on the OpenCL
+            device via `cv2.UMat`. Defaults to False.
 
     Returns:
         Image: The rectified image wrapped in the `Image` class.
     """
-    if isinstance(data, Camera):
-        image = data._image_raw
-        camera_info = data.info
-    else:
-        image, camera_info = data
-
-    mapx, mapy = cv2.initUndistortRectifyMap(
-        cameraMatrix=camera_info.camera_mtx,
-        distCoeffs=camera_info.distortion_mtx[:-1],
-        R=camera_info.rectification_mtx,
-        newCameraMatrix=camera_info.projection_mtx,
-        size=camera_info.shape,
-        m1type=cv2.CV_16SC2
-    )
+    image, camera_info = data
+    return get_rect_img_raw(image, camera_info, performance_mode, use_opencl)
+
+
+@get_rect_img.register(Camera)
+def _get_rect_img_camera(data: Camera, performance_mode: bool = True, use_opencl: bool = False) -> Image:
+    """Rectify the raw image of a Camera object, see `get_rect_img`."""
+    return get_rect_img_raw(data._image_raw, data.info, performance_mode, use_opencl)
+
+
+def get_rect_img_raw(image: Image, camera_info: CameraInformation, performance_mode: bool = True,
+                     use_opencl: bool = False) -> Image:
+    """Rectify an Image with the given CameraInformation, see `get_rect_img`.
+
+    Args:
+        image (Image): The raw image.
+        camera_info (CameraInformation): The calibration parameters of the camera.
+        performance_mode (bool, optional): If True, bilinear interpolation is used, otherwise Lanczos4. Defaults to True.
+        use_opencl (bool, optional): If True and OpenCL is available to OpenCV, the remapping runs on the OpenCL
+            device via `cv2.UMat`. Defaults to False.
+
+    Returns:
+        Image: The rectified image wrapped in the `Image` class. An image that was already rectified
+               with the same calibration is returned unchanged.
+    """
+    key = _get_rectification_key(camera_info)
+    if image._rect_key == key:
+        return image
+
+    use_opencl = use_opencl and _opencl_available()
+    rectified_image = _remap(image, camera_info, key, performance_mode, use_opencl)
+    if use_opencl:
+        rectified_image = rectified_image.get()
+    return _as_rectified_image(rectified_image, image.timestamp, key)
+
+
+def get_rect_imgs(data: Iterable[Union[Camera, Tuple[Image, CameraInformation]]], performance_mode: bool = True,
+                  use_opencl: bool = False) -> List[Image]:
+    """Rectify a batch of images, see `get_rect_img`.
 
+    With OpenCL, all images are submitted to the device before the first result is downloaded,
+    so uploads, remapping and downloads of consecutive images can overlap.
+
+    Args:
+        data (Iterable[Union[Camera, Tuple[Image, CameraInformation]]]): Camera objects or tuples of an Image
+            object and a CameraInformation object.
+        performance_mode (bool, optional): If True, bilinear interpolation is used, otherwise Lanczos4. Defaults to True.
+        use_opencl (bool, optional): If True and OpenCL is available to OpenCV, the remapping runs on the OpenCL
+            device via `cv2.UMat`. Defaults to False.
+
+    Returns:
+        List[Image]: The rectified images wrapped in the `Image` class.
+    """
+    if not (use_opencl and _opencl_available()):
+        return [get_rect_img(item, performance_mode) for item in data]
+
+    images = [(image, camera_info, _get_rectification_key(camera_info))
+              for image, camera_info in map(_unpack_rect_input, data)]
+    # Submit all images before downloading the first result, already rectified images are passed through
+    rectified_images = [image if image._rect_key == key else _remap(image, camera_info, key, performance_mode, True)
+                        for image, camera_info, key in images]
+    return [rectified_image if rectified_image is image
+            else _as_rectified_image(rectified_image.get(), image.timestamp, key)
+            for (image, _, key), rectified_image in zip(images, rectified_images)]
+
+
+@singledispatch
+def _unpack_rect_input(data: Tuple[Image, CameraInformation]) -> Tuple[Image, CameraInformation]:
+    """Return the raw image and the camera information of a rectification input."""
+    image, camera_info = data
+    return image, camera_info
+
+
+@_unpack_rect_input.register(Camera)
+def _unpack_rect_input_camera(data: Camera) -> Tuple[Image, CameraInformation]:
+    """Return the raw image and the camera information of a Camera object."""
+    return data._image_raw, data.info
+
+
+def _remap(image: Image, camera_info: CameraInformation, key: Tuple, performance_mode: bool,
+           use_opencl: bool) -> Union[np.ndarray, cv2.UMat]:
+    """Remap an image with the cached rectification maps, returning a UMat if OpenCL is used."""
     interpolation_algorithm = cv2.INTER_LINEAR if performance_mode else cv2.INTER_LANCZOS4
+    # CV_16SC2 maps: integer coordinates (mapx) plus the interpolation table indices (mapy)
+    if use_opencl:
+        mapx, mapy = _get_rectification_umaps(camera_info, key)
+        src = cv2.UMat(np.ascontiguousarray(image.image_np))
+    else:
+        mapx, mapy = _get_rectification_maps(camera_info, key)
+        src = image.image_np
+    return cv2.remap(src, mapx, mapy, interpolation=interpolation_algorithm)
 
-    rectified_image = cv2.remap(np.array(image.image), mapx, mapy, interpolation=interpolation_algorithm)
 
-    return Image(PilImage.fromarray(rectified_image), image.timestamp)
+def _as_rectified_image(rectified_image: np.ndarray, timestamp, key: Tuple) -> Image:
+    """Wrap a rectified array in an Image marked with the calibration key it was rectified with."""
+    image = Image.from_array(rectified_image, timestamp)
+    image._rect_key = key
+    return image
 
 
 def get_disparity_map(camera_left: Camera, camera_right: Camera,
-                      stereo_param: Optional[cv2.StereoSGBM] = None) -> np.ndarray:
+                      stereo_param: Optional[cv2.StereoSGBM] = None, num_disparities: Optional[int] = None,
+                      min_depth: float = 3.0, scale: float = 1.0, backend: str = 'cpu',
+                      num_threads: int = 1) -> np.ndarray:
     """Compute a disparity map from a pair of stereo images.
 
     This function computes a disparity map using stereo block matching.
     The disparity map is based on the rectified grayscale images of the stereo camera pair.
+    As the matching cost scales linearly with the disparity range, the default matcher only searches
+    the disparities that are possible for objects farther away than `min_depth`. With the 'cuda' backend,
+    the matching runs on the GPU using OpenCV's CUDA StereoSGM, which requires an OpenCV build with CUDA support.
 
     Args:
         camera_left (Camera): The left camera of the stereo pair.
         camera_right (Camera): The right camera of the stereo pair.
         stereo_param (Optional[cv2.StereoSGBM]): Optional custom StereoSGBM parameters for disparity calculation.
                                                  If not provided, default parameters will be used.
+        num_disparities (Optional[int]): Disparity search range of the default matcher (divisible by 16).
+                                         If not provided, it is derived from the focal length, the stereo
+                                         baseline and `min_depth`. Ignored if `stereo_param` is given.
+        min_depth (float): Minimum depth in meters used to derive the disparity search range. Defaults to 3.0.
+        scale (float): Resolution scale for the stereo matching. Values below 1.0 match downscaled images and
+                       upsample the resulting disparity map to the original resolution, trading detail for speed.
+                       Defaults to 1.0.
+        backend (str): The device for the stereo matching ('cpu' or 'cuda'). With 'cuda', `stereo_param` must
+                       be a CUDA matcher such as `cv2.cuda.StereoSGM`. Defaults to 'cpu'.
+        num_threads (int): Number of overlapping horizontal bands matched in parallel threads on the 'cpu'
+                           backend. This only helps for matchers in MODE_SGBM or MODE_HH, which OpenCV runs
+                           single-threaded. The default SGBM_3WAY matcher is already parallelized by OpenCV, so
+                           values above 1 are rejected for it. Values above 1 may introduce small differences at
+                           the band borders. Defaults to 1.
 
     Returns:
         np.ndarray: The computed disparity map.
+
+    Raises:
+        ValueError: If the scale is out of range, the backend is unknown, a CPU matcher is passed with the
+                    'cuda' backend or `num_threads` is above 1 for a matcher that is not in MODE_SGBM or MODE_HH.
+        RuntimeError: If the 'cuda' backend is requested but no CUDA device is available to OpenCV.
     """
-    img1_gray = np.array(camera_left.image.convert('L'))
-    img2_gray = np.array(camera_right.image.convert('L'))
+    if not 0 < scale <= 1:
+        raise ValueError("Scale must be in the range (0, 1].")
+    if backend not in ('cpu', 'cuda'):
+        raise ValueError("Unsupported backend. Use 'cpu' or 'cuda'.")
+
+    img1_gray = _to_gray(camera_left.image.image_np)
+    img2_gray = _to_gray(camera_right.image.image_np)
+    height, width = img1_gray.shape
+
+    if scale < 1:
+        img1_gray = cv2.resize(img1_gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        img2_gray = cv2.resize(img2_gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+    if stereo_param is None:
+        num_disparities = num_disparities or get_num_disparities(camera_right.info, min_depth)
+        # The disparity range shrinks with the image width, rounded up to a multiple of 16
+        num_disparities = max(16, int(np.ceil(num_disparities * scale / 16)) * 16)
+
+    if backend == 'cuda':
+        disparity_map = _compute_disparity_cuda(img1_gray, img2_gray, stereo_param, num_disparities)
+    else:
+        stereo = stereo_param or _create_default_stereo_sgbm(num_disparities)
+        if num_threads > 1:
+            if stereo.getMode() not in (cv2.STEREO_SGBM_MODE_SGBM, cv2.STEREO_SGBM_MODE_HH):
+                raise ValueError("num_threads > 1 is only supported for matchers in MODE_SGBM or MODE_HH.")
+            disparity_map = _compute_disparity_tiled(stereo, img1_gray, img2_gray, num_threads)
+        else:
+            disparity_map = stereo.compute(img1_gray, img2_gray).astype(np.float32)
+
+    if scale < 1:
+        min_disparity = stereo_param.getMinDisparity() if stereo_param is not None else 0
+        disparity_map = _upsample_disparity(disparity_map, (width, height), scale, min_disparity)
+
+    return disparity_map
+
 
-    stereo = stereo_param or _create_default_stereo_sgbm()
-    disparity_map = stereo.compute(img1_gray, img2_gray).astype(np.float32)
+def _upsample_disparity(disparity_map: np.ndarray, size: Tuple[int, int], scale: float,
+                        min_disparity: int) -> np.ndarray:
+    """Upsample a disparity map matched at a reduced scale without blending invalid pixels into valid ones.
 
+    The matchers mark invalid pixels with (min_disparity - 1) * 16. Every upsampled pixel that is interpolated
+    from at least one invalid pixel is set back to the invalid value, as the blend would be a bogus disparity.
+    """
+    invalid_value = (min_disparity - 1) * 16
+    invalid = (disparity_map <= invalid_value).astype(np.float32)
+    disparity_map = cv2.resize(disparity_map * (1 / scale), size, interpolation=cv2.INTER_LINEAR)
+    touches_invalid = cv2.resize(invalid, size, interpolation=cv2.INTER_LINEAR) > 0
+    disparity_map[touches_invalid] = invalid_value
     return disparity_map
 
 
-def _create_default_stereo_sgbm() -> cv2.StereoSGBM:
-    """Create default StereoSGBM parameters for disparity computation."""
+def get_disparity_map_census(img_left_gray: np.ndarray, img_right_gray: np.ndarray, max_disp: int = 128,
+                             window_size: int = 5) -> np.ndarray:
+    """Compute a disparity map with a census transform matcher (Experimental).
+
+    Each pixel is described by a 32-bit center-symmetric census transform (CSCT) over a 9x7 window, the matching
+    cost is the Hamming distance between the descriptors. The costs are aggregated over a square window and the
+    disparity with the lowest cost is refined with a parabolic sub-pixel fit. The full cost volume is never held
+    in memory. If `numba` is installed, the matching runs as a compiled kernel parallelized over horizontal bands,
+    which runs in roughly the time of the SGBM matcher per core. Without `numba`, a NumPy implementation is used,
+    which is considerably slower than SGBM.
+
+    Note: This function is experimental and has not been extensively tested on real-world data. The quality of the results may vary.
+
+    Args:
+        img_left_gray (np.ndarray): The rectified left grayscale image.
+        img_right_gray (np.ndarray): The rectified right grayscale image.
+        max_disp (int): The number of disparities to search. Defaults to 128.
+        window_size (int): The size of the cost aggregation window, must be odd. Defaults to 5.
+
+    Returns:
+        np.ndarray: The computed disparity map, scaled by 16 like the output of `get_disparity_map`.
+    """
+    if window_size % 2 == 0:
+        raise ValueError("Window size must be odd.")
+    height, width = img_left_gray.shape
+    num_disp = min(max_disp, width)
+
+    if _census_match_numba is not None:
+        desc_left = np.empty((height, width), dtype=np.uint32)
+        desc_right = np.empty((height, width), dtype=np.uint32)
+        _census_transform_numba(np.ascontiguousarray(img_left_gray), desc_left)
+        _census_transform_numba(np.ascontiguousarray(img_right_gray), desc_right)
+        disparity_map = np.empty((height, width), dtype=np.float32)
+        # Bands are large enough to amortize the initial window sums, and numerous enough to balance the threads
+        band_height = max(16, int(np.ceil(height / (4 * numba.get_num_threads()))))
+        _census_match_numba(desc_left, desc_right, num_disp, window_size // 2, _POPCOUNT_LUT16,
+                            _CENSUS_INVALID_COST, band_height, disparity_map)
+        return disparity_map
+
+    return _census_match_numpy(_census_transform(img_left_gray), _census_transform(img_right_gray), num_disp,
+                               window_size)
+
+
+# Number of set bits for every 16-bit value, popcount of a 32-bit descriptor takes two lookups
+_POPCOUNT_LUT16 = np.array([bin(value).count('1') for value in range(1 << 16)], dtype=np.uint8)
+# Matching cost for disparities that point outside the right image, above any Hamming distance of 31 bits
+_CENSUS_INVALID_COST = 32
+
+
+def _census_match_numpy(desc_left: np.ndarray, desc_right: np.ndarray, num_disp: int,
+                        window_size: int) -> np.ndarray:
+    """Match census descriptors one disparity at a time with NumPy, see `get_disparity_map_census`."""
+    height, width = desc_left.shape
+    best_cost = np.full((height, width), np.inf, dtype=np.float32)
+    best_disp = np.zeros((height, width), dtype=np.int32)
+    cost_before = np.zeros((height, width), dtype=np.float32)
+    cost_after = np.zeros((height, width), dtype=np.float32)
+    cost = np.empty((height, width), dtype=np.uint8)
+    prev_cost = None
+
+    for disp in range(num_disp):
+        diff = desc_left[:, disp:] ^ desc_right[:, :width - disp]
+        cost[:, :disp] = _CENSUS_INVALID_COST
+        np.add(_POPCOUNT_LUT16[diff & 0xFFFF], _POPCOUNT_LUT16[diff >> 16], out=cost[:, disp:])
+        # Float sums are exact for any practical window and, unlike CV_16U, do not saturate for large windows
+        agg_cost = cv2.boxFilter(cost, cv2.CV_32F, (window_size, window_size), normalize=False,
+                                 borderType=cv2.BORDER_REPLICATE)
+
+        # The cost after the current best disparity is only known one step later
+        np.putmask(cost_after, best_disp == disp - 1, agg_cost)
+
+        is_better = agg_cost < best_cost
+        np.putmask(cost_before, is_better, prev_cost if prev_cost is not None else agg_cost)
+        np.putmask(cost_after, is_better, agg_cost)
+        np.putmask(best_disp, is_better, disp)
+        np.minimum(best_cost, agg_cost, out=best_cost)
+        prev_cost = agg_cost
+
+    disparity_map = best_disp.astype(np.float32)
+    denom = cost_before - 2 * best_cost + cost_after
+    # The parabola needs both neighbors, so the first and last disparity are not refined
+    refine = (denom > 0) & (best_disp > 0) & (best_disp < num_disp - 1)
+    disparity_map += np.where(refine, (cost_before - cost_after) / (2 * np.where(refine, denom, 1)), 0)
+
+    return disparity_map * 16
+
+
+def _census_transform(img_gray: np.ndarray) -> np.ndarray:
+    """Compute the 9x7 center-symmetric census transform, one bit per symmetric pixel pair (31 bits)."""
+    height, width = img_gray.shape
+    padded = cv2.copyMakeBorder(img_gray, 3, 3, 4, 4, cv2.BORDER_REPLICATE)
+    descriptor = np.zeros((height, width), dtype=np.uint32)
+    # Half of the window without the center, each offset is compared to its point-symmetric counterpart
+    offsets = [(dy, dx) for dy in range(-3, 1) for dx in range(-4, 5) if dy < 0 or dx < 0]
+    for bit, (dy, dx) in enumerate(offsets):
+        pixel = padded[3 + dy:3 + dy + height, 4 + dx:4 + dx + width]
+        mirrored = padded[3 - dy:3 - dy + height, 4 - dx:4 - dx + width]
+        descriptor |= (pixel > mirrored).astype(np.uint32) << np.uint32(bit)
+    return descriptor
+
+
+def _compute_disparity_tiled(stereo: cv2.StereoSGBM, img1_gray: np.ndarray, img2_gray: np.ndarray,
+                             num_bands: int) -> np.ndarray:
+    """Compute the disparity map in overlapping horizontal bands, each matched in its own thread.
+
+    The bands overlap by at least 64 rows on each side, which are discarded when stitching. The semi-global
+    aggregation paths that run vertically and diagonally cross the whole image in a single pass, so a band
+    only approximates the single pass result. The overlap lets these paths settle before the kept rows, which
+    keeps the differences at the band borders small but does not remove them.
+    Every thread uses its own copy of the matcher, as the matcher objects are not thread-safe.
+    """
+    height = img1_gray.shape[0]
+    band_height = int(np.ceil(height / num_bands))
+    overlap = max(2 * stereo.getBlockSize() + 1, 64)
+    disparity_map = np.empty(img1_gray.shape, dtype=np.float32)
+
+    def compute_band(start: int):
+        end = min(start + band_height, height)
+        band_start, band_end = max(start - overlap, 0), min(end + overlap, height)
+        band = _clone_stereo_sgbm(stereo).compute(img1_gray[band_start:band_end], img2_gray[band_start:band_end])
+        disparity_map[start:end] = band[start - band_start:end - band_start]
+
+    with ThreadPoolExecutor(max_workers=num_bands) as executor:
+        list(executor.map(compute_band, range(0, height, band_height)))
+
+    return disparity_map
+
+
+def _clone_stereo_sgbm(stereo: cv2.StereoSGBM) -> cv2.StereoSGBM:
+    """Create a new StereoSGBM object with the same parameters."""
+    return cv2.StereoSGBM_create(
+        minDisparity=stereo.getMinDisparity(),
+        numDisparities=stereo.getNumDisparities(),
+        blockSize=stereo.getBlockSize(),
+        P1=stereo.getP1(),
+        P2=stereo.getP2(),
+        disp12MaxDiff=stereo.getDisp12MaxDiff(),
+        preFilterCap=stereo.getPreFilterCap(),
+        uniquenessRatio=stereo.getUniquenessRatio(),
+        speckleWindowSize=stereo.getSpeckleWindowSize(),
+        speckleRange=stereo.getSpeckleRange(),
+        mode=stereo.getMode()
+    )
+
+
+def _compute_disparity_cuda(img1_gray: np.ndarray, img2_gray: np.ndarray, stereo_param=None,
+                            num_disparities: Optional[int] = None) -> np.ndarray:
+    """Compute the disparity map on the GPU, reusing the matcher and device buffers of the calling thread.
+
+    The upload, matching and download are queued on one CUDA stream, which is synchronized once at the end.
+    The host side uses pageable NumPy memory: the OpenCV Python bindings copy every host `Mat` from and to a
+    NumPy array, so page-locked `cv2.cuda.HostMem` buffers cannot be passed to the transfers without an extra copy.
+    """
+    # cv::cuda::StereoSGM derives from cv::StereoSGBM, so only matchers that are not CUDA matchers are rejected
+    cuda_stereo_sgm = getattr(cv2, 'cuda_StereoSGM', None) or getattr(getattr(cv2, 'cuda', None), 'StereoSGM', None)
+    is_cuda_matcher = cuda_stereo_sgm is not None and isinstance(stereo_param, cuda_stereo_sgm)
+    if isinstance(stereo_param, cv2.StereoSGBM) and not is_cuda_matcher:
+        raise ValueError("The 'cuda' backend requires a CUDA matcher such as cv2.cuda.StereoSGM, "
+                         "not a CPU cv2.StereoSGBM.")
+    if not hasattr(cv2, 'cuda') or cv2.cuda.getCudaEnabledDeviceCount() == 0:
+        raise RuntimeError("The 'cuda' backend requires an OpenCV build with CUDA support and a CUDA device.")
+
+    if not hasattr(_CUDA_STATE, 'stream'):
+        _CUDA_STATE.stream = cv2.cuda_Stream()
+        _CUDA_STATE.gpu_left = cv2.cuda_GpuMat()
+        _CUDA_STATE.gpu_right = cv2.cuda_GpuMat()
+        _CUDA_STATE.gpu_disparity = cv2.cuda_GpuMat()
+        _CUDA_STATE.matchers = {}
+
+    if stereo_param is None:
+        # CUDA StereoSGM supports 64, 128 and 256 disparities only
+        num_disparities = next(n for n in (64, 128, 256) if n >= min(num_disparities, 256))
+        if num_disparities not in _CUDA_STATE.matchers:
+            _CUDA_STATE.matchers[num_disparities] = cv2.cuda.createStereoSGM(minDisparity=0,
+                                                                             numDisparities=num_disparities)
+        stereo_param = _CUDA_STATE.matchers[num_disparities]
+
+    stream = _CUDA_STATE.stream
+    _CUDA_STATE.gpu_left.upload(img1_gray, stream)
+    _CUDA_STATE.gpu_right.upload(img2_gray, stream)
+    _CUDA_STATE.gpu_disparity = stereo_param.compute(_CUDA_STATE.gpu_left, _CUDA_STATE.gpu_right,
+                                                     disparity=_CUDA_STATE.gpu_disparity, stream=stream)
+    disparity_map = _CUDA_STATE.gpu_disparity.download(stream)
+    stream.waitForCompletion()
+    return disparity_map.astype(np.float32)
+
+
+def _get_stereo_geometry(camera_info: CameraInformation) -> Tuple[float, float]:
+    """Return the focal length in pixels and the stereo baseline in meters of a stereo camera."""
+    focal_length = camera_info.camera_mtx[0][0]
+    stereo_tf = Transformation('stereo_right', 'stereo_left', camera_info.stereo_transform)
+    baseline = abs(stereo_tf.translation[0])
+    return focal_length, baseline
+
+
+def get_num_disparities(camera_info: CameraInformation, min_depth: float = 3.0) -> int:
+    """Derive the disparity search range of the default matcher for a stereo camera.
+
+    This is the range that `get_disparity_map` searches at full resolution if no `num_disparities` is given.
+    The leftmost `num_disparities` columns of the disparity map have no match within this range.
+
+    Args:
+        camera_info (CameraInformation): Calibration of the right camera of the stereo pair.
+        min_depth (float): Minimum depth in meters that must be matched. Defaults to 3.0.
+
+    Returns:
+        int: The disparity search range, rounded up to a multiple of 16 within [64, 256].
+    """
+    focal_length, baseline = _get_stereo_geometry(camera_info)
+    max_disparity = int(np.ceil(focal_length * baseline / min_depth / 16) * 16)
+    return int(np.clip(max_disparity, 64, 256))
+
+
+def _to_gray(image_np: np.ndarray) -> np.ndarray:
+    """Convert an RGB image array to grayscale, single channel images are returned unchanged."""
+    if image_np.ndim == 2:
+        return image_np
+    return cv2.cvtColor(image_np, cv2.COLOR_RGB2GRAY)
+
+
+def _create_default_stereo_sgbm(num_disparities: int = 128) -> cv2.StereoSGBM:
+    """Create default StereoSGBM parameters for disparity computation, num_disparities must be divisible by 16."""
     window_size = 5
     min_disparity = 0
-    num_disparities = 128  # Must be divisible by 16
     block_size = window_size
 
     stereo = cv2.StereoSGBM_create(
@@ -107,7 +670,9 @@ def _create_default_stereo_sgbm() -> cv2.StereoSGBM:
 
 
 def get_depth_map(camera_left: Camera, camera_right: Camera,
-                  stereo_param: Optional[cv2.StereoSGBM] = None) -> np.ndarray:
+                  stereo_param: Optional[cv2.StereoSGBM] = None, num_disparities: Optional[int] = None,
+                  min_depth: float = 3.0, scale: float = 1.0, backend: str = 'cpu',
+                  num_threads: int = 1) -> np.ndarray:
     """Generate a depth map from a pair of stereo camera images (Experimental).
 
     This function computes the depth map by first calculating the disparity map between the left and right
@@ -121,21 +686,120 @@ def get_depth_map(camera_left: Camera, camera_right: Camera,
                                from this camera are used for disparity-to-depth conversion.
         stereo_param (Optional[cv2.StereoSGBM]): Optional StereoSGBM parameter object for controlling the stereo matching.
                                                  If not provided, default parameters will be used for disparity calculation.
+        num_disparities (Optional[int]): Disparity search range of the default matcher, see `get_disparity_map`.
+        min_depth (float): Minimum depth in meters used to derive the disparity search range. Defaults to 3.0.
+        scale (float): Resolution scale for the stereo matching, see `get_disparity_map`. Defaults to 1.0.
+        backend (str): The device for the stereo matching ('cpu' or 'cuda'). Defaults to 'cpu'.
+        num_threads (int): Number of threads for band-parallel matching, see `get_disparity_map`. Defaults to 1.
 
     Returns:
         np.ndarray: The computed depth map.
     """
-    disparity_map = get_disparity_map(camera_left, camera_right, stereo_param)
+    disparity_map = get_disparity_map(camera_left, camera_right, stereo_param, num_disparities, min_depth, scale,
+                                      backend, num_threads)
 
     depth_map = disparity_to_depth(disparity_map, camera_right)
 
     return depth_map
 
 
+class StereoDepthEstimator:
+    """Class for computing depth maps from a fixed stereo camera pair with reused buffers (Experimental).
+
+    This class holds everything that stays constant between frames of a stereo camera pair: the rectification
+    maps, the stereo matcher and the intermediate grayscale and disparity buffers. Each call converts the raw
+    images to grayscale, rectifies the grayscale images directly into the preallocated buffers and computes
+    the disparity map in place, so no intermediate images are allocated after the first frame.
+    An instance must not be shared between threads, as the buffers are reused for each call.
+
+    Attributes:
+        camera_left_info (CameraInformation): Calibration of the left camera.
+        camera_right_info (CameraInformation): Calibration of the right camera, used for disparity-to-depth conversion.
+        num_disparities (int): Disparity search range of the stereo matcher.
+        stereo (cv2.StereoSGBM): The stereo matcher.
+    """
+
+    def __init__(self, camera_left_info: CameraInformation, camera_right_info: CameraInformation,
+                 num_disparities: Optional[int] = None, min_depth: float = 3.0,
+                 stereo_param: Optional[cv2.StereoSGBM] = None):
+        """Initialize a StereoDepthEstimator object for a stereo camera pair.
+
+        Args:
+            camera_left_info (CameraInformation): Calibration of the left camera.
+            camera_right_info (CameraInformation): Calibration of the right camera.
+            num_disparities (Optional[int]): Disparity search range of the default matcher, rounded up to a multiple
+                                             of 16. If not provided, it is derived from the stereo geometry and
+                                             `min_depth`.
+            min_depth (float): Minimum depth in meters used to derive the disparity search range. Defaults to 3.0.
+            stereo_param (Optional[cv2.StereoSGBM]): Optional custom StereoSGBM parameters for disparity calculation.
+        """
+        self.camera_left_info = camera_left_info
+        self.camera_right_info = camera_right_info
+        if stereo_param is None:
+            num_disparities = num_disparities or get_num_disparities(camera_right_info, min_depth)
+            # StereoSGBM requires a multiple of 16, rounded up like in `get_disparity_map`
+            self.num_disparities = max(16, int(np.ceil(num_disparities / 16)) * 16)
+            self.stereo = _create_default_stereo_sgbm(self.num_disparities)
+        else:
+            self.num_disparities = stereo_param.getNumDisparities()
+            self.stereo = stereo_param
+
+        self._maps_left = _get_rectification_maps(camera_left_info)
+        self._maps_right = _get_rectification_maps(camera_right_info)
+
+        width, height = camera_left_info.shape
+        self._gray_raw_l: Optional[np.ndarray] = None
+        self._gray_raw_r: Optional[np.ndarray] = None
+        self._gray_l = np.empty((height, width), dtype=np.uint8)
+        self._gray_r = np.empty((height, width), dtype=np.uint8)
+        self._disparity = np.empty((height, width), dtype=np.int16)
+        self._disparity_f = np.empty((height, width), dtype=np.float32)
+
+    def __call__(self, image_left: Union[Camera, Image], image_right: Union[Camera, Image]) -> np.ndarray:
+        """Compute the depth map for a pair of raw stereo images.
+
+        Args:
+            image_left (Union[Camera, Image]): The raw left image, or the left camera.
+            image_right (Union[Camera, Image]): The raw right image, or the right camera.
+
+        Returns:
+            np.ndarray: The computed depth map.
+        """
+        if isinstance(image_left, Camera):
+            image_left = image_left._image_raw
+        if isinstance(image_right, Camera):
+            image_right = image_right._image_raw
+
+        self._gray_raw_l = self._rectify_gray(image_left.image_np, self._gray_raw_l, self._maps_left, self._gray_l)
+        self._gray_raw_r = self._rectify_gray(image_right.image_np, self._gray_raw_r, self._maps_right, self._gray_r)
+
+        self.stereo.compute(self._gray_l, self._gray_r, self._disparity)
+        np.copyto(self._disparity_f, self._disparity)
+
+        return disparity_to_depth(self._disparity_f, self.camera_right_info)
+
+    @staticmethod
+    def _rectify_gray(image_np: np.ndarray, gray_raw: Optional[np.ndarray], maps: Tuple[np.ndarray, np.ndarray],
+                      gray_rect: np.ndarray) -> np.ndarray:
+        """Convert a raw image to grayscale and rectify it into gray_rect, returning the raw grayscale buffer.
+
+        Grayscale input is rectified directly, the caller's array is never used as the scratch buffer.
+        """
+        if image_np.ndim == 2:
+            cv2.remap(image_np, maps[0], maps[1], interpolation=cv2.INTER_LINEAR, dst=gray_rect)
+            return gray_raw
+        if gray_raw is None or gray_raw.shape != image_np.shape[:2]:
+            gray_raw = np.empty(image_np.shape[:2], dtype=np.uint8)
+        cv2.cvtColor(image_np, cv2.COLOR_RGB2GRAY, dst=gray_raw)
+        cv2.remap(gray_raw, maps[0], maps[1], interpolation=cv2.INTER_LINEAR, dst=gray_rect)
+        return gray_raw
+
+
 def disparity_to_depth(disparity_map: np.ndarray, camera_info: Union[Camera, CameraInformation]) -> np.ndarray:
     """Convert a disparity map to a depth map using camera parameters (Experimental).
 
     This function converts a disparity map into a depth map using the intrinsic parameters of the camera.
+    If `numba` is installed, the conversion of 2D maps runs as a compiled kernel parallelized over the rows.
 
     Note: This function is experimental and has not been extensively tested on real-world data. The quality of the results may vary.
 
@@ -147,16 +811,27 @@ def disparity_to_depth(disparity_map: np.ndarray, camera_info: Union[Camera, Cam
     Returns:
         np.ndarray: The computed depth map, with masked areas where disparity is zero.
     """
-    if hasattr(camera_info, 'info'):
-        camera_info = camera_info.info
+    focal_length, baseline = _get_stereo_geometry(_get_camera_info(camera_info))
+
+    dtype = disparity_map.dtype if np.issubdtype(disparity_map.dtype, np.floating) else np.float32
+    if _depth_from_disparity_numba is not None and disparity_map.ndim == 2:
+        depth_map = np.empty(disparity_map.shape, dtype=dtype)
+        _depth_from_disparity_numba(disparity_map, float(focal_length * baseline), depth_map)
     else:
-        camera_info = camera_info
+        # Divide only where the disparity is valid, all other pixels keep the preset infinite depth
+        depth_map = np.full(disparity_map.shape, np.inf, dtype=dtype)
+        np.divide(focal_length * baseline, disparity_map, out=depth_map, where=disparity_map > 0)
 
-    focal_length = camera_info.camera_mtx[0][0]
-    stereo_tf = Transformation('stereo_right', 'stereo_left', camera_info.stereo_transform)
-    baseline = abs(stereo_tf.translation[0])
+    return depth_map
 
-    with np.errstate(divide='ignore'):
-        depth_map = np.where(disparity_map > 0, (focal_length * baseline) / disparity_map, np.inf)
 
-    return depth_map
+@singledispatch
+def _get_camera_info(camera_info: CameraInformation) -> CameraInformation:
+    """Return the CameraInformation of a CameraInformation or Camera object."""
+    return camera_info
+
+
+@_get_camera_info.register(Camera)
+def _get_camera_info_camera(camera: Camera) -> CameraInformation:
+    """Return the CameraInformation of a Camera object."""
+    return camera.info
@@ -10,19 +10,25 @@ Functions:
     save_image(image, output_path, filename, dtype):
         Saves a single image to disk in the specified format ('JPEG' or 'PNG').
 
-    save_all_images_in_frame(frame, output_path, create_subdir, use_raw, dtype):
-        Saves all images from the cameras in a frame.
+    save_all_images_in_frame(frame, output_path, create_subdir, use_raw, dtype, num_threads):
+        Saves all images from the cameras in a frame using a thread pool.
+
+    rectify_frame_multithreaded(frame, performance_mode, num_threads):
+        Rectifies the images of all cameras in a frame using a thread pool.
 
     save_dataset_images_multithreaded(dataset, save_dir, create_subdir, use_raw, dtype, num_cores):
         Saves images from a dataset using multithreading for faster processing.
 """
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import os
 from coopscenes import Dataloader, Image
-from typing import Union
+from typing import Optional, Union
 import multiprocessing as mp
 import sys
 from PIL import Image as PilImage
+import numpy as np
+import cv2
 
 
 def get_maneuver_split(dataset_dir, return_paths=False):
@@ -97,41 +103,89 @@ def save_image(image: Union['Image', PilImage.Image], output_path: str, filename
     """Saves a single image to disk in the specified format.
 
     This function saves an image (raw or processed) to a specified directory with a given filename.
-    The supported formats are 'JPEG' and 'PNG'.
+    The supported formats are 'JPEG' and 'PNG'. The images are encoded with OpenCV, which uses
+    libjpeg-turbo and a fast PNG compression level (3) instead of PIL's encoders.
 
     Args:
-        image (Union[Image, PilImage.Image]): The image to be saved. If an `Image` object is provided,
-            its internal `PilImage` representation is used.
+        image (Union[Image, PilImage.Image]): The image to be saved. PIL modes other than L, RGB, RGBA
+            and I;16 are converted before encoding.
         output_path (str): The directory where the image will be saved.
         filename (str): The name of the file (without extension).
         dtype (str, optional): The format in which to save the image ('JPEG' or 'PNG'). Defaults to 'PNG'.
 
     Raises:
-        ValueError: If an unsupported format is specified.
+        ValueError: If an unsupported format is specified or the image cannot be stored without loss of data.
+        OSError: If the image could not be written.
     """
-    if isinstance(image, Image):
-        image = image.image
-
     dtype = dtype.upper()
     if dtype == "JPEG":
         ext = "jpg"
+        params = [cv2.IMWRITE_JPEG_QUALITY, 75]
     elif dtype == "PNG":
         ext = "png"
+        params = [cv2.IMWRITE_PNG_COMPRESSION, 3]
     else:
         raise ValueError("Unsupported format. Use 'JPEG' or 'PNG'.")
 
     os.makedirs(output_path, exist_ok=True)
     output_file = os.path.join(output_path, f'{filename}.{ext}')
-    image.save(output_file, format=dtype)
+
+    image_np = _to_writable_array(image)
+    if image_np.ndim == 3 and image_np.shape[2] == 3:
+        image_np = cv2.cvtColor(image_np, cv2.COLOR_RGB2BGR)
+    elif image_np.ndim == 3 and image_np.shape[2] == 4:
+        image_np = cv2.cvtColor(image_np, cv2.COLOR_RGBA2BGRA)
+
+    if not cv2.imwrite(output_file, image_np, params):
+        raise OSError(f"Could not write image to '{output_file}'.")
+
+
+def _to_writable_array(image: Union['Image', PilImage.Image]) -> np.ndarray:
+    """Convert an image to a NumPy array in a layout that `cv2.imwrite` can encode.
+
+    The cached array of an `Image` is only used if no PIL image was created from it yet, since the PIL image
+    could have been edited in place afterwards. PIL modes other than L, RGB, RGBA and I;16 are converted first,
+    mode 'I' only if its values fit into 16 bits.
+
+    Args:
+        image (Union[Image, PilImage.Image]): The image to convert.
+
+    Returns:
+        np.ndarray: The image as an 8-bit gray, RGB or RGBA array, or a 16-bit gray array.
+
+    Raises:
+        ValueError: If the image is a float image or a 32-bit image with values outside of 16 bits.
+    """
+    if isinstance(image, Image):
+        array_backed = image._image is None and image._image_np is not None
+        if array_backed and image._image_np.dtype in (np.uint8, np.uint16):
+            return image._image_np
+        image = image.image
+    if image.mode == 'F':
+        raise ValueError("Floating point images (mode 'F') cannot be saved as 'JPEG' or 'PNG'.")
+    if image.mode == '1':
+        image = image.convert('L')
+    elif image.mode == 'I':
+        low, high = image.getextrema()
+        if low < 0 or high > 65535:
+            raise ValueError("32-bit images (mode 'I') can only be saved if all values are within [0, 65535].")
+        image = image.convert('I;16')
+    elif image.mode not in ('L', 'RGB', 'RGBA', 'I;16'):
+        has_alpha = 'A' in image.mode or 'transparency' in image.info
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+    return np.asarray(image)
 
 
 def save_all_images_in_frame(frame, output_path: str, create_subdir: bool = True, use_raw: bool = False,
-                             dtype: str = 'PNG'):
+                             dtype: str = 'PNG', num_threads: Optional[int] = None,
+                             executor: Optional[ThreadPoolExecutor] = None):
     """Saves all images from the cameras in a frame.
 
     This function iterates through all cameras in the given frame and saves their images
     to the specified output directory. It optionally creates subdirectories for each camera
-    and supports saving raw or processed images in the specified format.
+    and supports saving raw or processed images in the specified format. Rectification and
+    encoding of the images run in a thread pool, as OpenCV and the image encoders release the GIL.
+    The right stereo camera of the vehicle is not saved.
 
     Args:
         frame: The frame object containing vehicle and tower cameras.
@@ -139,28 +193,71 @@ def save_all_images_in_frame(frame, output_path: str, create_subdir: bool = True
         create_subdir (bool, optional): Whether to create subdirectories for each camera. Defaults to True.
         use_raw (bool, optional): Whether to save raw images instead of processed images. Defaults to False.
         dtype (str, optional): The format in which to save the images ('JPEG' or 'PNG'). Defaults to 'PNG'.
+        num_threads (Optional[int], optional): Number of threads used to save the images. Defaults to the number of CPUs.
+        executor (Optional[ThreadPoolExecutor], optional): An existing thread pool to save the images with, e.g. to
+            reuse one pool across frames. If given, `num_threads` is ignored. Defaults to None.
 
     Raises:
         ValueError: If an unsupported format is specified.
     """
     os.makedirs(output_path, exist_ok=True)
-    for agent in frame:
-        for camera_name, camera in agent.cameras:
-            image_to_save = camera._image_raw if use_raw else camera.image
-            timestamp = image_to_save.get_timestamp()
-
-            if create_subdir:
-                camera_dir = os.path.join(output_path, camera_name.lower())
-                os.makedirs(camera_dir, exist_ok=True)
-                save_path = camera_dir
-                save_image(image_to_save, output_path=save_path, filename=timestamp, dtype=dtype)
-            else:
-                save_path = output_path
-                save_image(image_to_save, output_path=save_path, filename=f'{timestamp}_{camera_name.lower()}',
-                           dtype=dtype)
-
-
-def _save_datarecord_images(datarecord, save_dir, create_subdir, use_raw, dtype):
+    tasks = [(camera_name, camera, output_path, create_subdir, use_raw, dtype)
+             for camera_name, camera in frame.iter_cameras(include_stereo_right=False)]
+
+    if executor is not None:
+        list(executor.map(lambda task: _save_camera_image(*task), tasks))
+        return
+    with ThreadPoolExecutor(max_workers=num_threads or os.cpu_count()) as executor:
+        list(executor.map(lambda task: _save_camera_image(*task), tasks))
+
+
+def _save_camera_image(camera_name: str, camera, output_path: str, create_subdir: bool, use_raw: bool, dtype: str):
+    """Saves the image of a single camera.
+
+    Args:
+        camera_name (str): The name of the camera, used for the subdirectory or filename.
+        camera: The camera whose image is saved.
+        output_path (str): The directory where the image will be saved.
+        create_subdir (bool): Whether to save the image in a subdirectory named after the camera.
+        use_raw (bool): Whether to save the raw image instead of the processed image.
+        dtype (str): The format in which to save the image ('JPEG' or 'PNG').
+    """
+    image_to_save = camera._image_raw if use_raw else camera.image
+    timestamp = image_to_save.get_timestamp()
+
+    if create_subdir:
+        save_path = os.path.join(output_path, camera_name.lower())
+        save_image(image_to_save, output_path=save_path, filename=timestamp, dtype=dtype)
+    else:
+        save_image(image_to_save, output_path=output_path, filename=f'{timestamp}_{camera_name.lower()}',
+                   dtype=dtype)
+
+
+def rectify_frame_multithreaded(frame, performance_mode: bool = True, num_threads: Optional[int] = None,
+                                executor: Optional[ThreadPoolExecutor] = None):
+    """Rectifies the images of all cameras in a frame using a thread pool.
+
+    The rectified images are stored in the cameras, so subsequent accesses of `camera.image`
+    return them without rectifying again. The cameras are independent of each other and
+    `cv2.remap` releases the GIL, so the rectification scales with the number of threads.
+
+    Args:
+        frame: The frame object containing vehicle and tower cameras.
+        performance_mode (bool, optional): If True, linear interpolation is used, otherwise Lanczos4. Defaults to True.
+        num_threads (Optional[int], optional): Number of threads used for rectification. Defaults to the number of CPUs.
+        executor (Optional[ThreadPoolExecutor], optional): An existing thread pool to rectify the images with, e.g. to
+            reuse one pool across frames. If given, `num_threads` is ignored. Defaults to None.
+    """
+    cameras = [camera for _, camera in frame.iter_cameras() if camera._image_raw is not None]
+
+    if executor is not None:
+        list(executor.map(lambda camera: camera.rectify(performance_mode), cameras))
+        return
+    with ThreadPoolExecutor(max_workers=num_threads or os.cpu_count()) as executor:
+        list(executor.map(lambda camera: camera.rectify(performance_mode), cameras))
+
+
+def _save_datarecord_images(datarecord, save_dir, create_subdir, use_raw, dtype, num_threads=1):
     """Saves all images from the frames in a datarecord.
 
     This function iterates through all frames in the given datarecord and saves the images
@@ -172,9 +269,11 @@ def _save_datarecord_images(datarecord, save_dir, create_subdir, use_raw, dtype)
         create_subdir (bool): Whether to create subdirectories for cameras.
         use_raw (bool): Whether to save raw images instead of processed images.
         dtype (str): The format in which to save the images ('JPEG' or 'PNG').
+        num_threads (int): Number of threads used to save the images, shared by all frames. Defaults to 1.
     """
-    for frame in datarecord:
-        save_all_images_in_frame(frame, save_dir, create_subdir, use_raw, dtype)
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        for frame in datarecord:
+            save_all_images_in_frame(frame, save_dir, create_subdir, use_raw, dtype, executor=executor)
 
 
 def save_dataset_images_multithreaded(dataset, save_dir: str, create_subdir: bool = True, use_raw: bool = False,
@@ -189,6 +288,8 @@ def save_dataset_images_multithreaded(dataset, save_dir: str, create_subdir: boo
         dtype (str, optional): The data type in which to save the image ('PNG' or 'JPEG'). Defaults to 'PNG'.
         num_cores (int, optional): Number of cores to use for multithreading. Defaults to 2.
     """
+    # The worker processes already run in parallel, so each one only gets its share of the CPUs for saving
+    num_threads = max(1, (os.cpu_count() or 1) // num_cores)
     with mp.Pool(processes=num_cores) as pool:
         batch = []
         total_records = len(dataset)
@@ -198,7 +299,8 @@ def save_dataset_images_multithreaded(dataset, save_dir: str, create_subdir: boo
 
             if len(batch) == num_cores:
                 results = [
-                    pool.apply_async(_save_datarecord_images, args=(record, save_dir, create_subdir, use_raw, dtype))
+                    pool.apply_async(_save_datarecord_images, args=(record, save_dir, create_subdir, use_raw, dtype,
+                                                                    num_threads))
                     for record in batch]
 
                 for result in results:
@@ -214,7 +316,8 @@ def save_dataset_images_multithreaded(dataset, save_dir: str, create_subdir: boo
             sys.stdout.flush()
 
         if batch:
-            results = [pool.apply_async(_save_datarecord_images, args=(record, save_dir, create_subdir, use_raw, dtype))
+            results = [pool.apply_async(_save_datarecord_images, args=(record, save_dir, create_subdir, use_raw, dtype,
+                                                                       num_threads))
                        for record in batch]
             for result in results:
                 try:
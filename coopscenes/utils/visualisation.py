@@ -5,7 +5,7 @@ This module provides functions for visualizing sensor data from autonomous vehic
 - Projections of LiDAR points onto camera images.
 
 Functions:
-    get_colored_stereo_image(camera_left, camera_right, cmap_name, min_value, max_value):
+    get_colored_stereo_image(camera_left, camera_right, cmap_name, min_value, max_value, min_depth):
         Computes and returns a depth map between two stereo camera images as a color-mapped image.
     plot_points_on_image(image, points, points_3d, cmap_name, radius, static_color, min_range, max_range, opacity):
         Overlays 2D points on a camera image with optional color mapping or static coloring.
@@ -21,11 +21,11 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from coopscenes.data import Lidar, Camera, LidarInformation, VehicleInformation, Frame, Vehicle, Tower
-from coopscenes.utils import get_projection, get_disparity_map, transform_points_to_origin
+from coopscenes.utils import get_projection, get_disparity_map, get_num_disparities, transform_points_to_origin
 
 
 def get_colored_stereo_image(camera_left: Camera, camera_right: Camera, cmap_name: str = "viridis",
-                             min_value: int = 0, max_value: int = 1000) -> PilImage:
+                             min_value: int = 0, max_value: int = 1000, min_depth: float = 3.0) -> PilImage:
     """Compute and return the disparity map between two stereo camera images as a color-mapped image.
 
        This function computes the disparity map from a pair of rectified stereo images using disparity calculation.
@@ -38,12 +38,16 @@ def get_colored_stereo_image(camera_left: Camera, camera_right: Camera, cmap_nam
            cmap_name (str): The name of the colormap to use for visualization. Defaults to "viridis".
            min_value (int): The minimum disparity value to normalize. Values below this are clamped. Defaults to 0.
            max_value (int): The maximum disparity value for normalization. Values above this are masked. Defaults to 1000.
+           min_depth (float): Minimum depth in meters used to derive the disparity search range. The leftmost columns
+               without a match in this range are cropped. Defaults to 3.0.
 
        Returns:
            PilImage: A color-mapped disparity map as a PIL image.
     """
     cmap = plt.get_cmap(cmap_name)
-    disparity_map = get_disparity_map(camera_left, camera_right)[:, 128:]
+    # The leftmost columns have no match in the right image within the disparity search range
+    num_disparities = get_num_disparities(camera_right.info, min_depth)
+    disparity_map = get_disparity_map(camera_left, camera_right, num_disparities=num_disparities)[:, num_disparities:]
 
     norm_values = (disparity_map - min_value) / (max_value - min_value)
 